@@ -6,11 +6,20 @@ All core logic is separated into binary/app and binary/api modules.
 """
 from flask import Flask
 from config import Config
-from binary.app import AppEngine, BackgroundTasks, WebRoutes
+from binary.app import AppEngine, BackgroundTasks, WebRoutes, ResponseCompression, FastJSONProvider
 
 # Initialize Flask
 app = Flask(__name__)
 
+# Match routes with or without a trailing slash instead of redirecting
+app.url_map.strict_slashes = False
+
+# Serialize jsonify() responses with orjson when available
+app.json = FastJSONProvider(app)
+
+# Reject oversized request bodies before they are read and parsed
+app.config['MAX_CONTENT_LENGTH'] = Config.MAX_CONTENT_LENGTH
+
 # Initialize application engine
 engine = AppEngine(Config)
 
@@ -20,6 +29,9 @@ web_routes = WebRoutes(app, engine.controller, Config)
 # Register API routes
 api_routes = engine.register_routes(app)
 
+# Compress JSON/HTML responses
+compression = ResponseCompression(app)
+
 # Start background tasks
 background_tasks = BackgroundTasks(engine, Config)
 background_tasks.start_all()
@@ -1,8 +1,8 @@
 """
 Alerts API - Handles all events from eve.json
 """
-import os
 import json
+from collections import deque
 from flask import jsonify
 
 
@@ -15,52 +15,56 @@ class AlertsAPI:
 
     def get_all_events(self, limit=100, category=None, protocol=None):
         """Get all events from eve.json with optional filters"""
-        if not os.path.exists(self.eve_log_path):
-            return {
-                'alerts': [],
-                'error': f'eve.json not found at {self.eve_log_path}'
-            }
-
         try:
-            events = []
+            # Only the newest `limit` matches are kept while scanning the file
+            events = deque(maxlen=max(limit, 0))
+            matched = 0
+            protocol = protocol.upper() if protocol else None
+            category = category.upper() if category else None
 
             with open(self.eve_log_path, 'r') as f:
                 for line in f:
-                    if not line.strip():
+                    line = line.strip()
+                    if not line:
                         continue
 
                     try:
-                        event = json.loads(line.strip())
+                        event = json.loads(line)
 
                         # Apply protocol filter
-                        if protocol and event.get('proto', '').upper() != protocol.upper():
+                        if protocol and event.get('proto', '').upper() != protocol:
                             continue
 
-                        # Parse event into alert format
-                        alert_data = self._parse_event(event, len(events) + 1)
-
-                        # Apply category filter
-                        if category and alert_data['category'].upper() != category.upper():
+                        # Apply category filter before building the alert dict
+                        event_type = event.get('event_type', 'unknown')
+                        details = self._get_event_details(event, event_type)
+                        if category and details[1].upper() != category:
                             continue
 
-                        events.append(alert_data)
+                        matched += 1
+                        events.append(self._parse_event(event, matched, details))
 
                     except json.JSONDecodeError:
                         continue
 
-            # Get most recent events
+            # Most recent events first
             events.reverse()
-            events = events[:limit]
 
-            return {'alerts': events, 'path': self.eve_log_path}
+            return {'alerts': list(events), 'path': self.eve_log_path}
 
+        except FileNotFoundError:
+            return {
+                'alerts': [],
+                'error': f'eve.json not found at {self.eve_log_path}'
+            }
         except Exception as e:
             return {'alerts': [], 'error': f'{str(e)} (path: {self.eve_log_path})'}
 
-    def _parse_event(self, event, event_id):
+    def _parse_event(self, event, event_id, details=None):
         """Parse event JSON into standardized alert format"""
-        event_type = event.get('event_type', 'unknown')
-        signature, category, severity = self._get_event_details(event, event_type)
+        if details is None:
+            details = self._get_event_details(event, event.get('event_type', 'unknown'))
+        signature, category, severity = details
 
         return {
             'id': event_id,
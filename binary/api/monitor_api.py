@@ -16,15 +16,6 @@ class MonitorAPI:
 
     def get_monitor_data(self, timespan='1h'):
         """Get monitoring data (TCP, UDP, Alerts counts)"""
-        if not os.path.exists(self.eve_log_path):
-            return {
-                'success': False,
-                'tcp_traffic': 0,
-                'udp_traffic': 0,
-                'total_alerts': 0,
-                'error': f'eve.json not found at {self.eve_log_path}'
-            }
-
         try:
             hours = self._parse_timespan(timespan)
             cutoff_time = datetime.utcnow().replace(tzinfo=timezone.utc) - timedelta(hours=hours)
@@ -83,6 +74,14 @@ class MonitorAPI:
                 'path': self.eve_log_path
             }
 
+        except FileNotFoundError:
+            return {
+                'success': False,
+                'tcp_traffic': 0,
+                'udp_traffic': 0,
+                'total_alerts': 0,
+                'error': f'eve.json not found at {self.eve_log_path}'
+            }
         except Exception as e:
             return {
                 'success': False,
@@ -1,167 +1,369 @@
 """
 API Routes - Centralized API endpoint definitions
 """
-from flask import request, jsonify, send_file
+import os
+import time
+import functools
+import yaml
+from datetime import datetime, timedelta
+from flask import g, request, jsonify, send_file
+from .singleflight import SingleFlight
+from ..suricata_config import SafeLoader, SafeDumper
+
+
+def etag_from_mtime(etag_source):
+    """Answer conditional GETs with 304 while the backing files are unchanged.
+
+    ``etag_source`` receives the routes instance and returns the ETag value for
+    the resource. The check runs before the view, so an unchanged resource is
+    never re-read or re-serialized. The value is left on ``g.resource_etag`` so
+    the view can reuse it instead of recomputing it.
+    """
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(self, *args, **kwargs):
+            try:
+                etag = etag_source(self)
+            except OSError:
+                g.resource_etag = None
+                return view(self, *args, **kwargs)
+
+            g.resource_etag = etag
+            if request.if_none_match.contains_weak(etag):
+                response = self.app.response_class(status=304)
+            else:
+                response = self.app.make_response(view(self, *args, **kwargs))
+            response.set_etag(etag, weak=True)
+            # Let browsers keep the body but revalidate it on every use
+            response.cache_control.private = True
+            response.cache_control.max_age = 0
+            response.cache_control.must_revalidate = True
+            return response
+        return wrapper
+    return decorator
+
+
+def _file_etag(path):
+    """Build an ETag value from a file's mtime and size"""
+    stat = os.stat(path)
+    return f"{stat.st_mtime_ns:x}-{stat.st_size:x}"
+
+
+_PORT_SERVICES = {
+    22: 'SSH', 80: 'HTTP', 443: 'HTTPS', 53: 'DNS',
+    67: 'DHCP', 68: 'DHCP', 21: 'FTP', 25: 'SMTP'
+}
+
+
+def _detect_service(src_port, dest_port):
+    """Detect service by port number, preferring the destination (server) side"""
+    service = _PORT_SERVICES.get(dest_port) or _PORT_SERVICES.get(src_port)
+    return f" ({service})" if service else ''
+
+
+# ===== eve.json log line formatters, keyed by event_type =====
+def _fmt_alert(log, timestamp):
+    alert = log.get('alert', {})
+    return (
+        f"[ALERT] {timestamp} - {alert.get('signature', 'Unknown')} | "
+        f"{log.get('src_ip', '')} -> {log.get('dest_ip', '')} "
+        f"[{log.get('proto', '')}] (Severity: {alert.get('severity', 0)})"
+    )
+
+
+def _fmt_stats(log, timestamp):
+    return f"[STATS] {timestamp} - Statistics Update"
+
+
+def _fmt_flow(log, timestamp):
+    src_port = log.get('src_port', '')
+    dest_port = log.get('dest_port', '')
+    return (
+        f"[FLOW] {timestamp} - {log.get('src_ip', '')}:{src_port} -> "
+        f"{log.get('dest_ip', '')}:{dest_port} [{log.get('proto', '')}]"
+        f"{_detect_service(src_port, dest_port)}"
+    )
+
+
+def _fmt_http(log, timestamp):
+    http = log.get('http', {})
+    return f"[HTTP] {timestamp} - {http.get('hostname', '')}{http.get('url', '')}"
+
+
+def _fmt_dns(log, timestamp):
+    return f"[DNS] {timestamp} - Query: {log.get('dns', {}).get('rrname', '')}"
+
+
+def _fmt_ssh(log, timestamp):
+    return f"[SSH] {timestamp} - {log.get('src_ip', '')} -> {log.get('dest_ip', '')}"
+
+
+def _fmt_tls(log, timestamp):
+    return f"[TLS] {timestamp} - SNI: {log.get('tls', {}).get('sni', '')}"
+
+
+def _fmt_default(log, timestamp):
+    return f"[{log.get('event_type', 'unknown').upper()}] {timestamp}"
+
+
+_LOG_FORMATTERS = {
+    'alert': _fmt_alert,
+    'stats': _fmt_stats,
+    'flow': _fmt_flow,
+    'http': _fmt_http,
+    'dns': _fmt_dns,
+    'ssh': _fmt_ssh,
+    'tls': _fmt_tls,
+}
+
+
+def _format_log(log):
+    """Format one eve.json record for display using its event type's formatter"""
+    formatter = _LOG_FORMATTERS.get(log.get('event_type', 'unknown'), _fmt_default)
+    return formatter(log, log.get('timestamp', ''))
 
 
 class APIRoutes:
     """Centralized API routes handler"""
 
-    def __init__(self, app, controller, rrd_manager, monitor_api, alerts_api, database_api):
-        self.app = app
-        self.controller = controller
-        self.rrd_manager = rrd_manager
-        self.monitor_api = monitor_api
-        self.alerts_api = alerts_api
-        self.database_api = database_api
-        self._register_routes()
+    # Seconds a serialized /api/status payload is reused before systemctl is queried again
+    STATUS_CACHE_TTL = 0.5
 
-    def _register_routes(self):
-        """Register all API routes"""
+    # Seconds a formatted /api/logs batch is reused before eve.json is read again
+    LOGS_CACHE_TTL = 1.0
+
+    # Upper bound for ?lines= on /api/logs/stream
+    LOGS_STREAM_MAX_LINES = 5000
+
+    # Seconds database info/stats results are reused; ?nocache=1 bypasses
+    DATABASE_CACHE_TTL = 5.0
+
+    # 0 sends no-cache: browsers keep the graph PNG but revalidate it on every load, so the
+    # page's Refresh and auto-refresh always get a cheap 304 or the newly rendered graph
+    GRAPH_MAX_AGE = 0
+
+    # (rule, endpoint, handler method, methods); None means the default GET
+    _ROUTES = (
         # Status & Control APIs
-        self.app.add_url_rule('/api/status', 'api_status', self.get_status)
-        self.app.add_url_rule('/api/start', 'api_start', self.start_suricata, methods=['POST'])
-        self.app.add_url_rule('/api/stop', 'api_stop', self.stop_suricata, methods=['POST'])
-        self.app.add_url_rule('/api/restart', 'api_restart', self.restart_suricata, methods=['POST'])
-        self.app.add_url_rule('/api/reload-rules', 'api_reload_rules', self.reload_rules, methods=['POST'])
+        ('/api/status', 'api_status', 'get_status', None),
+        ('/api/start', 'api_start', 'start_suricata', ['POST']),
+        ('/api/stop', 'api_stop', 'stop_suricata', ['POST']),
+        ('/api/restart', 'api_restart', 'restart_suricata', ['POST']),
+        ('/api/reload-rules', 'api_reload_rules', 'reload_rules', ['POST']),
 
         # Logs API
-        self.app.add_url_rule('/api/logs', 'api_logs', self.get_logs)
+        ('/api/logs', 'api_logs', 'get_logs', None),
+        ('/api/logs/stream', 'api_logs_stream', 'get_logs_stream', None),
 
         # Rules API
-        self.app.add_url_rule('/api/rules', 'api_rules', self.get_rules)
+        ('/api/rules', 'api_rules', 'get_rules', None),
 
         # Config API
-        self.app.add_url_rule('/api/config', 'api_config_get', self.get_config, methods=['GET'])
-        self.app.add_url_rule('/api/config', 'api_config_post', self.save_config, methods=['POST'])
+        ('/api/config', 'api_config_get', 'get_config', ['GET']),
+        ('/api/config', 'api_config_post', 'save_config', ['POST']),
 
         # Monitor APIs
-        self.app.add_url_rule('/api/monitor/data', 'api_monitor_data', self.get_monitor_data)
-        self.app.add_url_rule('/api/monitor/graph/<metric>/<timespan>', 'api_monitor_graph', self.get_monitor_graph)
+        ('/api/monitor/data', 'api_monitor_data', 'get_monitor_data', None),
+        ('/api/monitor/graph/<metric>/<timespan>', 'api_monitor_graph', 'get_monitor_graph', None),
 
         # Database APIs
-        self.app.add_url_rule('/api/database/info', 'api_database_info', self.get_database_info)
-        self.app.add_url_rule('/api/database/alerts', 'api_database_alerts', self.get_database_alerts)
-        self.app.add_url_rule('/api/database/stats', 'api_database_stats', self.get_database_stats)
-        self.app.add_url_rule('/api/database/check', 'api_database_check', self.check_database)
-        self.app.add_url_rule('/api/database/traffic/latest', 'api_traffic_latest', self.get_latest_traffic)
-        self.app.add_url_rule('/api/database/traffic/recent', 'api_traffic_recent', self.get_recent_traffic)
-        self.app.add_url_rule('/api/database/reset-counter', 'api_reset_counter', self.reset_counter, methods=['POST'])
+        ('/api/database/info', 'api_database_info', 'get_database_info', None),
+        ('/api/database/alerts', 'api_database_alerts', 'get_database_alerts', None),
+        ('/api/database/stats', 'api_database_stats', 'get_database_stats', None),
+        ('/api/database/check', 'api_database_check', 'check_database', None),
+        ('/api/database/traffic/latest', 'api_traffic_latest', 'get_latest_traffic', None),
+        ('/api/database/traffic/recent', 'api_traffic_recent', 'get_recent_traffic', None),
+        ('/api/database/reset-counter', 'api_reset_counter', 'reset_counter', ['POST']),
 
         # Debug APIs
-        self.app.add_url_rule('/api/debug/eve', 'api_debug_eve', self.debug_eve)
+        ('/api/debug/eve', 'api_debug_eve', 'debug_eve', None),
+    )
+
+    def __init__(self, app, controller, rrd_manager, monitor_api, alerts_api, database_api):
+        self.app = app
+        self.controller = controller
+        self.rrd_manager = rrd_manager
+        self.monitor_api = monitor_api
+        self.alerts_api = alerts_api
+        self.database_api = database_api
+
+        # Managers used by the handlers, bound once instead of per request
+        self.suricata_config = controller.config
+        self.log_manager = controller.log_manager
+        self.rule_manager = controller.rule_manager
+        self.db_manager = database_api.db_manager
+
+        self._singleflight = SingleFlight()
+        self._yaml_cache = {}
+        self._status_cache = (0.0, None)
+        self._logs_cache = (0.0, None)
+        self._rules_cache = (None, None)
+        self._ttl_cache = {}
+        self._register_routes()
+
+    def _register_routes(self):
+        """Register all API routes"""
+        for rule, endpoint, handler_name, methods in self._ROUTES:
+            self.app.add_url_rule(rule, endpoint, getattr(self, handler_name), methods=methods)
+
+    def _cached(self, key, ttl, fn):
+        """Return fn() reused for ttl seconds; ?nocache=1 forces a fresh call"""
+        now = time.monotonic()
+        entry = self._ttl_cache.get(key)
+        if entry is not None and now < entry[0] and request.args.get('nocache') != '1':
+            return entry[1]
+
+        result = self._singleflight.do(key, fn)
+        self._ttl_cache[key] = (now + ttl, result)
+        return result
 
     # ==================== Status & Control ====================
     def get_status(self):
         """Get Suricata status"""
-        return jsonify(self.controller.get_status())
+        cached_at, body = self._status_cache
+        if body is None or time.monotonic() - cached_at >= self.STATUS_CACHE_TTL:
+            # Concurrent pollers on a stale entry share one controller call
+            body = self._singleflight.do('status', self._refresh_status)
+        return self.app.response_class(body, mimetype='application/json')
+
+    def _refresh_status(self):
+        """Query the controller and store the serialized status"""
+        body = jsonify(self.controller.get_status()).get_data()
+        self._status_cache = (time.monotonic(), body)
+        return body
+
+    def _invalidate_status(self):
+        """Drop the cached status so the next poll sees a state change"""
+        self._status_cache = (0.0, None)
 
     def start_suricata(self):
         """Start Suricata"""
-        return jsonify(self.controller.start())
+        result = self.controller.start()
+        self._invalidate_status()
+        return jsonify(result)
 
     def stop_suricata(self):
         """Stop Suricata"""
-        return jsonify(self.controller.stop())
+        result = self.controller.stop()
+        self._invalidate_status()
+        return jsonify(result)
 
     def restart_suricata(self):
         """Restart Suricata"""
-        return jsonify(self.controller.restart())
+        result = self.controller.restart()
+        self._invalidate_status()
+        return jsonify(result)
 
     def reload_rules(self):
         """Reload Suricata rules"""
-        return jsonify(self.controller.reload_rules())
+        result = self.controller.reload_rules()
+        self._invalidate_status()
+        self.invalidate_rules()
+        return jsonify(result)
 
     # ==================== Logs ====================
     def get_logs(self):
         """Get Suricata logs"""
-        try:
-            eve_logs = self.controller.log_manager.get_eve_log(100)
+        now = time.monotonic()
+        cached_at, cached_logs = self._logs_cache
+        if cached_logs is not None and now - cached_at < self.LOGS_CACHE_TTL:
+            return jsonify({'logs': cached_logs})
 
-            if eve_logs:
-                formatted_logs = self._format_logs(eve_logs)
-                return jsonify({'logs': formatted_logs})
-            else:
-                return jsonify({'logs': []})
+        try:
+            eve_logs = self.log_manager.get_eve_log(100)
+            formatted_logs = self._format_logs(eve_logs) if eve_logs else []
+            self._logs_cache = (now, formatted_logs)
+            return jsonify({'logs': formatted_logs})
 
         except Exception as e:
             return jsonify({'error': str(e), 'logs': []})
 
-    def _format_logs(self, logs):
-        """Format eve.json logs for display"""
-        formatted = []
-        for log in logs:
-            event_type = log.get('event_type', 'unknown')
-            timestamp = log.get('timestamp', '')
-
-            if event_type == 'alert':
-                alert = log.get('alert', {})
-                formatted.append(
-                    f"[ALERT] {timestamp} - {alert.get('signature', 'Unknown')} | "
-                    f"{log.get('src_ip', '')} -> {log.get('dest_ip', '')} "
-                    f"[{log.get('proto', '')}] (Severity: {alert.get('severity', 0)})"
-                )
-            elif event_type == 'stats':
-                formatted.append(f"[STATS] {timestamp} - Statistics Update")
-            elif event_type == 'flow':
-                src = f"{log.get('src_ip', '')}:{log.get('src_port', '')}"
-                dest = f"{log.get('dest_ip', '')}:{log.get('dest_port', '')}"
-                service = self._detect_service(log.get('src_port'), log.get('dest_port'))
-                formatted.append(f"[FLOW] {timestamp} - {src} -> {dest} [{log.get('proto', '')}]{service}")
-            elif event_type == 'http':
-                http = log.get('http', {})
-                formatted.append(f"[HTTP] {timestamp} - {http.get('hostname', '')}{http.get('url', '')}")
-            elif event_type == 'dns':
-                dns = log.get('dns', {})
-                formatted.append(f"[DNS] {timestamp} - Query: {dns.get('rrname', '')}")
-            elif event_type == 'ssh':
-                formatted.append(f"[SSH] {timestamp} - {log.get('src_ip', '')} -> {log.get('dest_ip', '')}")
-            elif event_type == 'tls':
-                tls = log.get('tls', {})
-                formatted.append(f"[TLS] {timestamp} - SNI: {tls.get('sni', '')}")
-            else:
-                formatted.append(f"[{event_type.upper()}] {timestamp}")
+    def get_logs_stream(self):
+        """Send recent Suricata logs as NDJSON, one formatted line per record.
+
+        The last ``lines`` raw lines are read from eve.json up front; parsing, formatting
+        and serialization then happen record by record as the response is written.
+        """
+        lines = min(request.args.get('lines', 100, type=int), self.LOGS_STREAM_MAX_LINES)
+        eve_logs = self.log_manager.iter_eve_log(lines)
+        dumps = self.app.json.dumps
 
-        return formatted
+        def generate():
+            for log in eve_logs:
+                yield dumps(_format_log(log)) + '\n'
 
-    def _detect_service(self, src_port, dest_port):
-        """Detect service by port number"""
-        services = {
-            22: 'SSH', 80: 'HTTP', 443: 'HTTPS', 53: 'DNS',
-            67: 'DHCP', 68: 'DHCP', 21: 'FTP', 25: 'SMTP'
-        }
-        for port in [src_port, dest_port]:
-            if port in services:
-                return f" ({services[port]})"
-        return ''
+        return self.app.response_class(generate(), mimetype='application/x-ndjson')
+
+    def _format_logs(self, logs):
+        """Format eve.json logs for display"""
+        return [_format_log(log) for log in logs]
 
     # ==================== Rules ====================
+    @etag_from_mtime(lambda self: self.rule_manager.get_signature())
     def get_rules(self):
         """Get Suricata rules"""
-        try:
-            rules = self.controller.rule_manager.get_rule_files()
-            return jsonify({'rules': rules})
-        except Exception as e:
-            return jsonify({'error': str(e)})
+        # Computed once per request by etag_from_mtime; None when the directory is unreadable
+        signature = g.resource_etag
+
+        cached_signature, body = self._rules_cache
+        if signature is None or body is None or signature != cached_signature:
+            try:
+                rules = self.rule_manager.get_rule_files()
+            except Exception as e:
+                return jsonify({'error': str(e)})
+            body = jsonify({'rules': rules}).get_data()
+            if signature is not None:
+                self._rules_cache = (signature, body)
+        return self.app.response_class(body, mimetype='application/json')
+
+    def invalidate_rules(self):
+        """Drop the cached rules listing so the next request re-reads the files"""
+        self._rules_cache = (None, None)
 
     # ==================== Config ====================
+    @etag_from_mtime(lambda self: _file_etag(self.suricata_config.config_path))
     def get_config(self):
         """Get Suricata configuration"""
         try:
-            import yaml
-            config_data = self.controller.config.load()
-            config_string = yaml.dump(config_data, default_flow_style=False, indent=2)
+            config_string = self._load_yaml_cached(self.suricata_config.config_path)
             return jsonify({'config': config_string})
         except Exception as e:
             return jsonify({'error': str(e)})
 
+    def _load_yaml_cached(self, path):
+        """Return the config at path dumped as YAML, re-parsing only when the file changed"""
+        stat = os.stat(path)
+        key = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        cached = self._yaml_cache.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        def parse():
+            config_data = self.suricata_config.load()
+            config_string = yaml.dump(config_data, Dumper=SafeDumper, default_flow_style=False, indent=2)
+            self._yaml_cache[path] = (key, config_string)
+            return config_string
+
+        # Concurrent misses for the same file version share one parse
+        return self._singleflight.do(('config_yaml', path, key), parse)
+
     def save_config(self):
         """Save Suricata configuration"""
+        payload = request.get_json(silent=True)
+        config_content = payload.get('config') if isinstance(payload, dict) else None
+        if not isinstance(config_content, str):
+            return jsonify({'success': False, 'message': 'Request body must be a JSON object with a "config" string'}), 400
+
         try:
-            import yaml
-            config_content = request.json.get('config', '')
-            config_data = yaml.safe_load(config_content)
-            self.controller.config.save(config_data)
+            config_data = yaml.load(config_content, Loader=SafeLoader)
+        except yaml.YAMLError as e:
+            return jsonify({'success': False, 'message': f'Invalid YAML: {e}'}), 400
+        if not isinstance(config_data, dict):
+            return jsonify({'success': False, 'message': 'Configuration must be a YAML mapping'}), 400
+
+        try:
+            self.suricata_config.save(config_data)
+            self._yaml_cache.pop(self.suricata_config.config_path, None)
             return jsonify({'success': True, 'message': 'Configuration saved successfully'})
         except Exception as e:
             return jsonify({'success': False, 'message': str(e)})
@@ -170,20 +372,26 @@ class APIRoutes:
     def get_monitor_data(self):
         """Get monitoring data from eve.json"""
         timespan = request.args.get('timespan', '1h')
-        return jsonify(self.monitor_api.get_monitor_data(timespan))
+        return jsonify(self._singleflight.do(
+            ('monitor_data', timespan),
+            lambda: self.monitor_api.get_monitor_data(timespan)
+        ))
 
     def get_monitor_graph(self, metric, timespan):
         """Generate monitoring graph"""
         result = self.rrd_manager.generate_graph(metric, timespan)
         if result.get('success'):
-            return send_file(result['graph_path'], mimetype='image/png')
+            # ETag/Last-Modified come from the PNG, which is only rewritten when the RRD changes
+            return send_file(result['graph_path'], mimetype='image/png',
+                             conditional=True,
+                             max_age=self.GRAPH_MAX_AGE)
         else:
             return jsonify(result), 400
 
     # ==================== Database ====================
     def get_database_info(self):
         """Get database information"""
-        return jsonify(self.database_api.get_info())
+        return jsonify(self._cached('database_info', self.DATABASE_CACHE_TTL, self.database_api.get_info))
 
     def get_database_alerts(self):
         """Get all events from eve.json"""
@@ -194,17 +402,16 @@ class APIRoutes:
 
     def get_database_stats(self):
         """Get latest statistics"""
-        return jsonify(self.database_api.get_stats())
+        return jsonify(self._cached('database_stats', self.DATABASE_CACHE_TTL, self.database_api.get_stats))
 
     def check_database(self):
         """Check database connection status"""
-        return jsonify(self.database_api.check_connection())
+        return jsonify(self._singleflight.do('database_check', self.database_api.check_connection))
 
     def get_latest_traffic(self):
         """Get latest traffic statistics from database"""
         try:
-            # Access db_manager through database_api
-            stats = self.database_api.db_manager.get_latest_traffic_stats()
+            stats = self.db_manager.get_latest_traffic_stats()
             return jsonify({
                 'success': True,
                 'stats': stats
@@ -218,16 +425,13 @@ class APIRoutes:
     def get_recent_traffic(self):
         """Get recent traffic statistics from database"""
         try:
-            from datetime import datetime, timedelta
-
             limit = request.args.get('limit', 20, type=int)
             protocol = request.args.get('protocol', None)
             hours = request.args.get('hours', 24, type=int)
 
             start_time = datetime.utcnow() - timedelta(hours=hours)
 
-            # Access db_manager through database_api
-            stats = self.database_api.db_manager.get_traffic_stats(
+            stats = self.db_manager.get_traffic_stats_dicts(
                 protocol=protocol,
                 start_time=start_time,
                 limit=limit
@@ -235,7 +439,7 @@ class APIRoutes:
 
             return jsonify({
                 'success': True,
-                'stats': [stat.to_dict() for stat in stats]
+                'stats': stats
             })
         except Exception as e:
             return jsonify({
@@ -0,0 +1,36 @@
+"""
+SingleFlight - Coalesce concurrent identical calls into one execution
+"""
+import threading
+from concurrent.futures import Future
+
+
+class SingleFlight:
+    """Share one in-flight result between concurrent callers of the same key"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._inflight = {}
+
+    def do(self, key, fn):
+        """Run fn for key, or wait for the call already running for that key"""
+        with self._lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
@@ -5,5 +5,7 @@ Suricata Dashboard Application Core
 from .engine import AppEngine
 from .background_tasks import BackgroundTasks
 from .web_routes import WebRoutes
+from .compression import ResponseCompression
+from .json_provider import FastJSONProvider
 
-__all__ = ['AppEngine', 'BackgroundTasks', 'WebRoutes']
+__all__ = ['AppEngine', 'BackgroundTasks', 'WebRoutes', 'ResponseCompression', 'FastJSONProvider']
@@ -2,15 +2,25 @@
 Background Tasks - All daemon threads for monitoring and sync
 """
 import os
-import json
 import time
 import threading
 from datetime import datetime
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 
 class BackgroundTasks:
     """Manages all background tasks for the application"""
 
+    # Maximum number of rows buffered before a bulk insert is flushed
+    DB_BATCH_SIZE = 500
+
+    # Bytes read per call when following eve.json and stats.log
+    LOG_READ_SIZE = 1024 * 1024
+
     def __init__(self, engine, config):
         self.engine = engine
         self.config = config
@@ -50,54 +60,62 @@ class BackgroundTasks:
         thread.start()
         self.threads.append(thread)
 
+    @staticmethod
+    def _sleep_until_next_run(last_run, interval, tag):
+        """Sleep until the next run is due and return its deadline, so run time does not add drift"""
+        next_run = last_run + interval
+        now = time.monotonic()
+        if next_run <= now:
+            # Skip slots the last run overran instead of firing back-to-back
+            missed = int((now - next_run) // interval) + 1
+            next_run += missed * interval
+            print(f"[{tag}] Run overran its {interval}s interval, skipping {missed} slot(s)")
+        time.sleep(next_run - now)
+        return next_run
+
     # ==================== Traffic Aggregation ====================
     def _aggregate_traffic_data(self):
         """Aggregate traffic data from eve.json to database"""
         eve_log_path = f"{self.config.SURICATA_LOG_DIR}/eve.json"
-        last_position = 0
+        eve_file = None
         interval_seconds = self.config.TRAFFIC_AGGREGATION_INTERVAL  # Configurable (default 5 min)
 
         while True:
             try:
-                if not os.path.exists(eve_log_path):
-                    time.sleep(interval_seconds)
-                    continue
+                # Follow eve.json like the alert sync; the handle stays open between intervals
+                if eve_file is None:
+                    eve_file = open(eve_log_path, 'rb')
 
                 # Aggregate counters
                 aggregated = {}
                 current_time = datetime.utcnow()
 
-                with open(eve_log_path, 'r') as f:
-                    f.seek(last_position)
-
-                    for line in f:
-                        try:
-                            event = json.loads(line.strip())
-                            event_type = event.get('event_type', '')
-                            proto = event.get('proto', 'UNKNOWN').upper()
-
-                            if proto not in aggregated:
-                                aggregated[proto] = {
-                                    'packet_count': 0,
-                                    'byte_count': 0,
-                                    'flow_count': 0,
-                                    'alert_count': 0
-                                }
-
-                            # Count flows
-                            if event_type == 'flow':
-                                aggregated[proto]['flow_count'] += 1
-                                aggregated[proto]['packet_count'] += event.get('flow', {}).get('pkts_toserver', 0) + event.get('flow', {}).get('pkts_toclient', 0)
-                                aggregated[proto]['byte_count'] += event.get('flow', {}).get('bytes_toserver', 0) + event.get('flow', {}).get('bytes_toclient', 0)
-
-                            # Count alerts
-                            if event_type == 'alert':
-                                aggregated[proto]['alert_count'] += 1
-
-                        except json.JSONDecodeError:
-                            continue
-
-                    last_position = f.tell()
+                for line in self._read_complete_lines(eve_file):
+                    try:
+                        event = json_loads(line)
+                        event_type = event.get('event_type', '')
+                        proto = event.get('proto', 'UNKNOWN').upper()
+
+                        if proto not in aggregated:
+                            aggregated[proto] = {
+                                'packet_count': 0,
+                                'byte_count': 0,
+                                'flow_count': 0,
+                                'alert_count': 0
+                            }
+
+                        # Count flows
+                        if event_type == 'flow':
+                            aggregated[proto]['flow_count'] += 1
+                            aggregated[proto]['packet_count'] += event.get('flow', {}).get('pkts_toserver', 0) + event.get('flow', {}).get('pkts_toclient', 0)
+                            aggregated[proto]['byte_count'] += event.get('flow', {}).get('bytes_toserver', 0) + event.get('flow', {}).get('bytes_toclient', 0)
+
+                        # Count alerts
+                        if event_type == 'alert':
+                            aggregated[proto]['alert_count'] += 1
+
+                    except ValueError:
+                        continue
 
                 # Store aggregated data to database
                 for proto, counts in aggregated.items():
@@ -115,6 +133,10 @@ class BackgroundTasks:
                     protocols = ', '.join([f"{p}:{v['flow_count']}" for p, v in aggregated.items()])
                     print(f"[TRAFFIC-AGG] Stored: {protocols} flows")
 
+                if self._log_rotated(eve_log_path, eve_file):
+                    eve_file.close()
+                    eve_file = None
+
             except FileNotFoundError:
                 pass
             except Exception as e:
@@ -125,6 +147,7 @@ class BackgroundTasks:
     # ==================== RRD Metrics ====================
     def _update_rrd_metrics(self):
         """Update RRD metrics from database every minute"""
+        next_run = time.monotonic()
         while True:
             try:
                 # Get latest traffic stats from database
@@ -135,47 +158,63 @@ class BackgroundTasks:
                 self.engine.rrd_manager.update_metrics()
             except Exception as e:
                 print(f"Error updating RRD metrics: {e}")
-            time.sleep(60)
+            next_run = self._sleep_until_next_run(next_run, 60, "RRD")
 
     # ==================== Alert Sync ====================
     def _sync_alerts_to_database(self):
         """Sync alerts from eve.json to database"""
-        last_position = 0
         eve_log_path = f"{self.config.SURICATA_LOG_DIR}/eve.json"
+        eve_file = None
 
         print(f"[ALERT-SYNC] Alert synchronization enabled - Real-time mode")
 
         while True:
             try:
-                with open(eve_log_path, 'r') as f:
-                    f.seek(last_position)
-
-                    for line in f:
-                        try:
-                            event = json.loads(line.strip())
-
-                            if event.get('event_type') == 'alert':
-                                alert = event.get('alert', {})
-                                alert_data = {
-                                    'timestamp': datetime.fromisoformat(event.get('timestamp', '').replace('Z', '+00:00')) if event.get('timestamp') else datetime.utcnow(),
-                                    'signature': alert.get('signature'),
-                                    'signature_id': alert.get('signature_id'),
-                                    'category': alert.get('category'),
-                                    'severity': alert.get('severity'),
-                                    'protocol': event.get('proto'),
-                                    'src_ip': event.get('src_ip'),
-                                    'src_port': event.get('src_port'),
-                                    'dest_ip': event.get('dest_ip'),
-                                    'dest_port': event.get('dest_port'),
-                                    'payload': event.get('payload'),
-                                    'extra_data': json.dumps(event)
-                                }
-                                self.engine.db_manager.add_alert(alert_data)
-
-                        except json.JSONDecodeError:
-                            continue
-
-                    last_position = f.tell()
+                # Keep one handle open and read whatever was appended since the last pass
+                if eve_file is None:
+                    eve_file = open(eve_log_path, 'rb')
+
+                batch = []
+                for line in self._read_complete_lines(eve_file):
+                    # Every alert record carries an "alert" key; skip flow/dns/http lines unparsed
+                    if b'"alert"' not in line:
+                        continue
+
+                    try:
+                        event = json_loads(line)
+
+                        if event.get('event_type') == 'alert':
+                            alert = event.get('alert', {})
+                            alert_data = {
+                                'timestamp': datetime.fromisoformat(event.get('timestamp', '').replace('Z', '+00:00')) if event.get('timestamp') else datetime.utcnow(),
+                                'signature': alert.get('signature'),
+                                'signature_id': alert.get('signature_id'),
+                                'category': alert.get('category'),
+                                'severity': alert.get('severity'),
+                                'protocol': event.get('proto'),
+                                'src_ip': event.get('src_ip'),
+                                'src_port': event.get('src_port'),
+                                'dest_ip': event.get('dest_ip'),
+                                'dest_port': event.get('dest_port'),
+                                'payload': event.get('payload'),
+                                # The raw line already is the event's JSON
+                                'extra_data': line.strip().decode('utf-8')
+                            }
+                            batch.append(alert_data)
+
+                            if len(batch) >= self.DB_BATCH_SIZE:
+                                self.engine.db_manager.add_alerts_bulk(batch)
+                                batch = []
+
+                    except ValueError:
+                        continue
+
+                if batch:
+                    self.engine.db_manager.add_alerts_bulk(batch)
+
+                if self._log_rotated(eve_log_path, eve_file):
+                    eve_file.close()
+                    eve_file = None
 
             except FileNotFoundError:
                 pass
@@ -188,7 +227,7 @@ class BackgroundTasks:
     def _sync_stats_to_database(self):
         """Sync statistics from stats.log to database"""
         stats_log_path = os.path.join(self.config.SURICATA_LOG_DIR, 'stats.log')
-        last_position = 0
+        stats_file = None
         current_timestamp = None
 
         print(f"[STATS-SYNC] Statistics synchronization enabled - Real-time mode")
@@ -203,64 +242,95 @@ class BackgroundTasks:
 
         while True:
             try:
-                if not os.path.exists(stats_log_path):
-                    time.sleep(10)
-                    continue
-
-                file_size = os.path.getsize(stats_log_path)
-                if file_size < last_position:
-                    last_position = 0
-
-                with open(stats_log_path, 'r', encoding='utf-8') as stats_file:
-                    stats_file.seek(last_position)
-
-                    for raw_line in stats_file:
-                        line = raw_line.strip()
-                        if not line:
-                            continue
-
-                        if line.lower().startswith('date:'):
-                            current_timestamp = _parse_timestamp(line)
-                            continue
-
-                        if '|' not in line:
-                            continue
-
-                        parts = [segment.strip() for segment in line.split('|') if segment.strip()]
-                        if len(parts) < 3:
-                            continue
-
-                        metric_name, scope, value_token = parts[0], parts[1], parts[2]
-                        try:
-                            metric_value = float(value_token.split()[0])
-                        except ValueError:
-                            continue
+                if stats_file is None:
+                    try:
+                        stats_file = open(stats_log_path, 'rb')
+                    except FileNotFoundError:
+                        time.sleep(10)
+                        continue
+
+                batch = []
+                for raw_line in self._read_complete_lines(stats_file):
+                    line = raw_line.decode('utf-8', 'replace').strip()
+                    if not line:
+                        continue
+
+                    if line.lower().startswith('date:'):
+                        current_timestamp = _parse_timestamp(line)
+                        continue
+
+                    # "metric | scope | value"; the header and ruler lines fail the checks below
+                    parts = line.split('|', 2)
+                    if len(parts) < 3:
+                        continue
+
+                    metric_name, scope, value_token = parts
+                    try:
+                        metric_value = float(value_token)
+                    except ValueError:
+                        continue
+
+                    metric_name = metric_name.strip()
+                    scope = scope.strip()
+                    timestamp = current_timestamp or datetime.utcnow()
+                    prefix, dot, _ = metric_name.partition('.')
+                    category = prefix if dot else scope.lower()
+
+                    batch.append({
+                        'timestamp': timestamp,
+                        'metric_name': metric_name,
+                        'metric_value': metric_value,
+                        'metric_type': scope,
+                        'category': category,
+                        'extra_data': {'scope': scope, 'raw': line},
+                    })
 
-                        timestamp = current_timestamp or datetime.utcnow()
-                        category = metric_name.split('.', 1)[0] if '.' in metric_name else scope.lower()
+                    if len(batch) >= self.DB_BATCH_SIZE:
+                        self.engine.db_manager.add_statistics_bulk(batch)
+                        batch = []
 
-                        self.engine.db_manager.add_statistic({
-                            'timestamp': timestamp,
-                            'metric_name': metric_name,
-                            'metric_value': metric_value,
-                            'metric_type': scope,
-                            'category': category,
-                            'extra_data': {'scope': scope, 'raw': line},
-                        })
+                if batch:
+                    self.engine.db_manager.add_statistics_bulk(batch)
 
-                    last_position = stats_file.tell()
+                if self._log_rotated(stats_log_path, stats_file):
+                    stats_file.close()
+                    stats_file = None
 
             except FileNotFoundError:
-                last_position = 0
+                pass
             except Exception as err:
                 print(f"[STATS-SYNC] Error: {err}")
 
             time.sleep(0.1)
 
+    @staticmethod
+    def _log_rotated(path, handle):
+        """True when path was replaced by a new file or truncated below the read offset"""
+        stat = os.stat(path)
+        return stat.st_ino != os.fstat(handle.fileno()).st_ino or stat.st_size < handle.tell()
+
+    def _read_complete_lines(self, handle):
+        """Yield the complete lines appended to a binary log handle since the last read"""
+        while True:
+            chunk = handle.read(self.LOG_READ_SIZE)
+            if not chunk:
+                return
+            if not chunk.endswith(b'\n'):
+                # Finish a line cut off by the read size
+                chunk += handle.readline()
+
+            complete, _, partial = chunk.rpartition(b'\n')
+            yield from complete.splitlines()
+            if partial:
+                # Suricata is mid-write; leave the partial line for the next pass
+                handle.seek(-len(partial), os.SEEK_CUR)
+                return
+
     # ==================== Database Retention ====================
     def _database_retention_worker(self):
         """Cleanup old database records"""
         cleanup_interval = 3600  # one hour
+        next_run = time.monotonic()
 
         while True:
             try:
@@ -277,13 +347,14 @@ class BackgroundTasks:
             except Exception as err:
                 print(f"[DB-CLEANUP] Error: {err}")
 
-            time.sleep(cleanup_interval)
+            next_run = self._sleep_until_next_run(next_run, cleanup_interval, "DB-CLEANUP")
 
     # ==================== Auto-Restart Monitor ====================
     def _auto_restart_monitor(self):
         """Monitor Suricata and auto-restart if crashed"""
         retry_count = 0
         last_status = None
+        next_run = time.monotonic()
 
         while True:
             try:
@@ -315,4 +386,4 @@ class BackgroundTasks:
             except Exception as e:
                 print(f"[AUTO-RESTART] Error: {e}")
 
-            time.sleep(self.config.AUTO_RESTART_CHECK_INTERVAL)
+            next_run = self._sleep_until_next_run(next_run, self.config.AUTO_RESTART_CHECK_INTERVAL, "AUTO-RESTART")
@@ -0,0 +1,43 @@
+"""
+Response Compression - gzip encoding for JSON and text responses
+"""
+import gzip
+from flask import request
+
+
+class ResponseCompression:
+    """Compress text responses for clients that accept gzip"""
+
+    MIMETYPES = frozenset({
+        'application/json',
+        'text/html',
+        'text/plain',
+    })
+    MIN_SIZE = 1024
+    LEVEL = 6
+
+    def __init__(self, app):
+        self.app = app
+        self.app.after_request(self.compress_response)
+
+    def compress_response(self, response):
+        """Gzip eligible responses; files and streamed bodies pass through untouched"""
+        if (response.direct_passthrough
+                or response.is_streamed
+                or not 200 <= response.status_code < 300
+                or 'Content-Encoding' in response.headers
+                or response.mimetype not in self.MIMETYPES):
+            return response
+
+        response.vary.add('Accept-Encoding')
+
+        if request.accept_encodings['gzip'] <= 0:
+            return response
+
+        data = response.get_data()
+        if len(data) < self.MIN_SIZE:
+            return response
+
+        response.set_data(gzip.compress(data, compresslevel=self.LEVEL))
+        response.headers['Content-Encoding'] = 'gzip'
+        return response
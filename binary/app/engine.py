@@ -67,6 +67,8 @@ class AppEngine:
                 'user': self.config.DB_USER,
                 'password': self.config.DB_PASSWORD,
                 'database': self.config.DB_NAME,
+                'pool_size': self.config.DB_POOL_SIZE,
+                'max_overflow': self.config.DB_MAX_OVERFLOW,
             }
         elif self.config.DB_TYPE == 'postgresql':
             return {
@@ -75,6 +77,8 @@ class AppEngine:
                 'user': self.config.DB_USER,
                 'password': self.config.DB_PASSWORD,
                 'database': self.config.DB_NAME,
+                'pool_size': self.config.DB_POOL_SIZE,
+                'max_overflow': self.config.DB_MAX_OVERFLOW,
             }
         else:
             raise ValueError(f"Unsupported database type: {self.config.DB_TYPE}")
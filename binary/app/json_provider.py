@@ -0,0 +1,54 @@
+"""
+JSON Provider - orjson-backed serialization for jsonify
+"""
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Encode and decode JSON with orjson when it is installed, stdlib json otherwise"""
+
+    # orjson always writes UTF-8; setting this back to True routes dumps through stdlib json
+    ensure_ascii = False
+
+    def dumps(self, obj, **kwargs):
+        """Serialize obj to a JSON string equivalent to the default provider's with the same settings"""
+        option = self._orjson_option(kwargs) if HAS_ORJSON else None
+        if option is None:
+            return super().dumps(obj, **kwargs)
+
+        try:
+            # Dates go through self.default so they keep Flask's HTTP-date format
+            return orjson.dumps(obj, default=self.default, option=option).decode()
+        except orjson.JSONEncodeError:
+            # e.g. integers wider than 64 bits; let stdlib json handle them
+            return super().dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs):
+        """Deserialize JSON from a str or bytes, e.g. request bodies read by get_json"""
+        if not HAS_ORJSON or kwargs:
+            return super().loads(s, **kwargs)
+
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            # NaN and Infinity literals are only accepted by stdlib json
+            return super().loads(s)
+
+    def _orjson_option(self, kwargs):
+        """Map the json.dumps arguments Flask passes to orjson options, or None if unsupported"""
+        indent = kwargs.get('indent')
+        if self.ensure_ascii or set(kwargs) - {'indent', 'separators'} or indent not in (None, 2):
+            return None
+
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return option
@@ -202,10 +202,12 @@ class SuricataBackendController:
 
     def get_system_info(self) -> Dict[str, Any]:
         """Get system information"""
+        # One snapshot serves both memory fields; each call re-reads /proc/meminfo
+        memory = psutil.virtual_memory()
         return {
             'platform': os.name,
             'cpu_count': psutil.cpu_count(),
-            'memory_total': psutil.virtual_memory().total,
-            'memory_available': psutil.virtual_memory().available,
+            'memory_total': memory.total,
+            'memory_available': memory.available,
             'disk_usage': psutil.disk_usage('/').percent if os.name != 'nt' else psutil.disk_usage('C:\\').percent
         }
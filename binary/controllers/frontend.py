@@ -1,5 +1,6 @@
+import yaml
 from typing import Dict, Any
-from ..suricata_config import SuricataConfig
+from ..suricata_config import SuricataConfig, SafeLoader, SafeDumper
 from ..suricata_rule_manager import SuricataRuleManager
 from ..suricata_log_manager import SuricataLogManager
 from .backend import SuricataBackendController
@@ -109,17 +110,15 @@ class SuricataFrontendController:
     def get_config_yaml(self) -> str:
         """Get configuration as YAML string"""
         try:
-            import yaml
             config_data = self.config.load()
-            return yaml.dump(config_data, default_flow_style=False, indent=2)
+            return yaml.dump(config_data, Dumper=SafeDumper, default_flow_style=False, indent=2)
         except Exception as e:
             return f"Error loading config: {str(e)}"
 
     def save_config_yaml(self, yaml_string: str) -> Dict[str, Any]:
         """Save configuration from YAML string"""
         try:
-            import yaml
-            config_data = yaml.safe_load(yaml_string)
+            config_data = yaml.load(yaml_string, Loader=SafeLoader)
             self.config.save(config_data)
             return {'success': True, 'message': 'Configuration saved successfully'}
         except Exception as e:
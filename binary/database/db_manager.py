@@ -1,9 +1,10 @@
-from sqlalchemy import func, text
+from sqlalchemy import func, insert, select, text
 from sqlalchemy.orm import sessionmaker, scoped_session
 from typing import Optional, List, Dict, Any
 from datetime import datetime, timedelta
 import json
 import hashlib
+import threading
 
 from .models import Base, Alert, Log, Statistics, TrafficStats
 from .mysql import create_mysql_engine
@@ -14,6 +15,15 @@ class DatabaseManager:
     """Database manager with support for MySQL and PostgreSQL."""
 
     SUPPORTED_DB_TYPES = ('mysql', 'postgresql')
+    DEFAULT_STAT_CATEGORIES = ('ssh', 'http', 'dns', 'total')
+    TRAFFIC_PROTOCOLS = ('TCP', 'UDP', 'ICMP')
+    EMPTY_TRAFFIC_STATS = {
+        'packet_count': 0,
+        'flow_count': 0,
+        'alert_count': 0,
+        'byte_count': 0,
+        'timestamp': None
+    }
 
     def __init__(self, db_type: str = 'postgresql', db_config: Optional[Dict[str, str]] = None):
         """Initialize database manager."""
@@ -31,6 +41,12 @@ class DatabaseManager:
         self.engine = None
         self.db_url = ''
 
+        # Rolling view of the newest statistic per category: category -> (timestamp, value)
+        self._latest_stats = {}
+        # Categories whose newest database row has been merged into the view
+        self._latest_stats_seeded = set()
+        self._latest_stats_lock = threading.Lock()
+
         self._initialize_database()
 
         self.Session = scoped_session(sessionmaker(bind=self.engine))
@@ -92,24 +108,29 @@ class DatabaseManager:
 
     # ==================== Alert Operations ====================
 
+    @staticmethod
+    def _alert_row(alert_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Map incoming alert data to Alert column values"""
+        return {
+            'timestamp': alert_data.get('timestamp', datetime.utcnow()),
+            'signature': alert_data.get('signature'),
+            'signature_id': alert_data.get('signature_id'),
+            'category': alert_data.get('category'),
+            'severity': alert_data.get('severity'),
+            'protocol': alert_data.get('protocol'),
+            'src_ip': alert_data.get('src_ip'),
+            'src_port': alert_data.get('src_port'),
+            'dest_ip': alert_data.get('dest_ip'),
+            'dest_port': alert_data.get('dest_port'),
+            'payload': alert_data.get('payload'),
+            'extra_data': json.dumps(alert_data.get('extra_data', {}))
+        }
+
     def add_alert(self, alert_data: Dict[str, Any]) -> Optional[Alert]:
         """Add a new alert to database"""
         session = self.get_session()
         try:
-            alert = Alert(
-                timestamp=alert_data.get('timestamp', datetime.utcnow()),
-                signature=alert_data.get('signature'),
-                signature_id=alert_data.get('signature_id'),
-                category=alert_data.get('category'),
-                severity=alert_data.get('severity'),
-                protocol=alert_data.get('protocol'),
-                src_ip=alert_data.get('src_ip'),
-                src_port=alert_data.get('src_port'),
-                dest_ip=alert_data.get('dest_ip'),
-                dest_port=alert_data.get('dest_port'),
-                payload=alert_data.get('payload'),
-                extra_data=json.dumps(alert_data.get('extra_data', {}))
-            )
+            alert = Alert(**self._alert_row(alert_data))
             session.add(alert)
             session.commit()
             return alert
@@ -120,6 +141,23 @@ class DatabaseManager:
         finally:
             session.close()
 
+    def add_alerts_bulk(self, alerts_data: List[Dict[str, Any]]) -> int:
+        """Insert many alerts with a single executemany and commit"""
+        if not alerts_data:
+            return 0
+
+        session = self.get_session()
+        try:
+            session.execute(insert(Alert), [self._alert_row(alert_data) for alert_data in alerts_data])
+            session.commit()
+            return len(alerts_data)
+        except Exception as e:
+            session.rollback()
+            print(f"Error adding alerts in bulk: {e}")
+            return 0
+        finally:
+            session.close()
+
     def get_alerts(self, limit: int = 100, offset: int = 0,
                    category: Optional[str] = None,
                    start_time: Optional[datetime] = None,
@@ -215,20 +253,26 @@ class DatabaseManager:
 
     # ==================== Statistics Operations ====================
 
+    @staticmethod
+    def _statistic_row(stat_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Map incoming statistic data to Statistics column values"""
+        return {
+            'timestamp': stat_data.get('timestamp', datetime.utcnow()),
+            'metric_name': stat_data.get('metric_name'),
+            'metric_value': stat_data.get('metric_value'),
+            'metric_type': stat_data.get('metric_type', 'gauge'),
+            'category': stat_data.get('category'),
+            'extra_data': json.dumps(stat_data.get('extra_data', {}))
+        }
+
     def add_statistic(self, stat_data: Dict[str, Any]) -> Optional[Statistics]:
         """Add a new statistic entry"""
         session = self.get_session()
         try:
-            stat = Statistics(
-                timestamp=stat_data.get('timestamp', datetime.utcnow()),
-                metric_name=stat_data.get('metric_name'),
-                metric_value=stat_data.get('metric_value'),
-                metric_type=stat_data.get('metric_type', 'gauge'),
-                category=stat_data.get('category'),
-                extra_data=json.dumps(stat_data.get('extra_data', {}))
-            )
+            stat = Statistics(**self._statistic_row(stat_data))
             session.add(stat)
             session.commit()
+            self._remember_latest_stat(stat_data.get('category'), stat.timestamp, stat.metric_value)
             return stat
         except Exception as e:
             session.rollback()
@@ -237,6 +281,33 @@ class DatabaseManager:
         finally:
             session.close()
 
+    def add_statistics_bulk(self, stats_data: List[Dict[str, Any]]) -> int:
+        """Insert many statistics with a single executemany and commit"""
+        if not stats_data:
+            return 0
+
+        rows = [self._statistic_row(stat_data) for stat_data in stats_data]
+        session = self.get_session()
+        try:
+            session.execute(insert(Statistics), rows)
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            print(f"Error adding statistics in bulk: {e}")
+            return 0
+        finally:
+            session.close()
+
+        # Only the newest row per category can move the latest-statistic view
+        latest = {}
+        for row in rows:
+            current = latest.get(row['category'])
+            if current is None or row['timestamp'] >= current['timestamp']:
+                latest[row['category']] = row
+        for category, row in latest.items():
+            self._remember_latest_stat(category, row['timestamp'], row['metric_value'])
+        return len(rows)
+
     def get_statistics(self, category: Optional[str] = None,
                       metric_name: Optional[str] = None,
                       start_time: Optional[datetime] = None,
@@ -267,30 +338,50 @@ class DatabaseManager:
         finally:
             session.close()
 
-    def get_latest_stats(self, categories: List[str] = None) -> Dict[str, float]:
-        """Get latest statistics for each category"""
-        session = self.get_session()
-        try:
-            if not categories:
-                categories = ['ssh', 'http', 'dns', 'total']
+    def _remember_latest_stat(self, category: Optional[str], timestamp: datetime, value: float) -> None:
+        """Advance the rolling latest-statistic view when this row is the newest seen for its category"""
+        with self._latest_stats_lock:
+            self._merge_latest_stat(category, timestamp, value)
 
-            result = {}
-            for category in categories:
-                stat = session.query(Statistics).filter(
-                    Statistics.category == category
-                ).order_by(Statistics.timestamp.desc()).first()
+    def _merge_latest_stat(self, category: Optional[str], timestamp: Optional[datetime], value: float) -> None:
+        """Keep whichever of the stored and given rows is newer; caller holds _latest_stats_lock"""
+        current = self._latest_stats.get(category)
+        if current is not None and current[0] is not None and (timestamp is None or timestamp < current[0]):
+            return
+        self._latest_stats[category] = (timestamp, value)
 
-                if stat:
-                    result[category] = stat.metric_value
-                else:
-                    result[category] = 0.0
-
-            return result
-        except Exception as e:
-            print(f"Error getting latest stats: {e}")
-            return {cat: 0.0 for cat in (categories or ['ssh', 'http', 'dns', 'total'])}
-        finally:
-            session.close()
+    def get_latest_stats(self, categories: List[str] = None) -> Dict[str, float]:
+        """Get latest statistics for each category"""
+        if not categories:
+            categories = self.DEFAULT_STAT_CATEGORIES
+
+        with self._latest_stats_lock:
+            missing = [category for category in categories if category not in self._latest_stats_seeded]
+
+        # Categories are read from the database once, then kept current by inserts
+        if missing:
+            session = self.get_session()
+            try:
+                for category in missing:
+                    stat = session.query(Statistics).filter(
+                        Statistics.category == category
+                    ).order_by(Statistics.timestamp.desc()).first()
+
+                    # Inserts that committed after the query above hold newer rows and win the merge
+                    with self._latest_stats_lock:
+                        if stat:
+                            self._merge_latest_stat(category, stat.timestamp, stat.metric_value)
+                        else:
+                            self._merge_latest_stat(category, None, 0.0)
+                        self._latest_stats_seeded.add(category)
+            except Exception as e:
+                print(f"Error getting latest stats: {e}")
+                return {cat: 0.0 for cat in categories}
+            finally:
+                session.close()
+
+        with self._latest_stats_lock:
+            return {category: self._latest_stats.get(category, (None, 0.0))[1] for category in categories}
 
     # ==================== Cleanup Operations ====================
 
@@ -317,6 +408,12 @@ class DatabaseManager:
 
             session.commit()
 
+            # Deleted rows may include the newest of a category; re-read on next request
+            if deleted_stats:
+                with self._latest_stats_lock:
+                    self._latest_stats.clear()
+                    self._latest_stats_seeded.clear()
+
             return {
                 'alerts_deleted': deleted_alerts,
                 'logs_deleted': deleted_logs,
@@ -361,17 +458,7 @@ class DatabaseManager:
         """Get traffic statistics with optional filtering"""
         session = self.get_session()
         try:
-            query = session.query(TrafficStats)
-
-            if protocol:
-                query = query.filter(TrafficStats.protocol == protocol.upper())
-
-            if start_time:
-                query = query.filter(TrafficStats.timestamp >= start_time)
-
-            if end_time:
-                query = query.filter(TrafficStats.timestamp <= end_time)
-
+            query = self._filter_traffic_stats(session.query(TrafficStats), protocol, start_time, end_time)
             stats = query.order_by(TrafficStats.timestamp.desc()).limit(limit).all()
             return stats
         except Exception as e:
@@ -380,14 +467,52 @@ class DatabaseManager:
         finally:
             session.close()
 
+    def get_traffic_stats_dicts(self, protocol: Optional[str] = None,
+                                start_time: Optional[datetime] = None,
+                                end_time: Optional[datetime] = None,
+                                limit: int = 1000) -> List[Dict[str, Any]]:
+        """Get traffic statistics as TrafficStats.to_dict() rows, skipping ORM object loading"""
+        session = self.get_session()
+        try:
+            query = self._filter_traffic_stats(select(*TrafficStats.__table__.columns), protocol, start_time, end_time)
+            rows = session.execute(
+                query.order_by(TrafficStats.timestamp.desc()).limit(limit)
+            ).mappings()
+
+            stats = []
+            for row in rows:
+                stat = dict(row)
+                timestamp = stat['timestamp']
+                stat['timestamp'] = timestamp.isoformat() if timestamp else None
+                stats.append(stat)
+            return stats
+        except Exception as e:
+            print(f"Error getting traffic stats: {e}")
+            return []
+        finally:
+            session.close()
+
+    @staticmethod
+    def _filter_traffic_stats(query, protocol, start_time, end_time):
+        """Apply the optional protocol/time-range filters shared by the traffic stats queries"""
+        if protocol:
+            query = query.filter(TrafficStats.protocol == protocol.upper())
+
+        if start_time:
+            query = query.filter(TrafficStats.timestamp >= start_time)
+
+        if end_time:
+            query = query.filter(TrafficStats.timestamp <= end_time)
+
+        return query
+
     def get_latest_traffic_stats(self) -> Dict[str, int]:
         """Get latest traffic statistics for each protocol"""
         session = self.get_session()
         try:
             result = {}
-            protocols = ['TCP', 'UDP', 'ICMP']
 
-            for proto in protocols:
+            for proto in self.TRAFFIC_PROTOCOLS:
                 stat = session.query(TrafficStats).filter(
                     TrafficStats.protocol == proto
                 ).order_by(TrafficStats.timestamp.desc()).first()
@@ -401,13 +526,7 @@ class DatabaseManager:
                         'timestamp': stat.timestamp
                     }
                 else:
-                    result[proto.lower()] = {
-                        'packet_count': 0,
-                        'flow_count': 0,
-                        'alert_count': 0,
-                        'byte_count': 0,
-                        'timestamp': None
-                    }
+                    result[proto.lower()] = dict(self.EMPTY_TRAFFIC_STATS)
 
             return result
         except Exception as e:
@@ -8,10 +8,12 @@ from sqlalchemy.engine import Engine
 
 
 DEFAULT_MYSQL_PORT = 3306
+DEFAULT_POOL_SIZE = 10
+DEFAULT_MAX_OVERFLOW = 20
 
 
-def _coerce_port(value: Any, default: int) -> int:
-    """Attempt to coerce the provided port value to an integer."""
+def _coerce_int(value: Any, default: int) -> int:
+    """Attempt to coerce the provided value to an integer."""
     try:
         return int(value)
     except (TypeError, ValueError):
@@ -35,7 +37,7 @@ def _build_query_string(params: Any) -> str:
 def create_mysql_engine(config: Dict[str, Any]) -> Tuple[str, Engine]:
     """Create a SQLAlchemy engine for MySQL and return the URL and engine."""
     host = config.get('host') or 'localhost'
-    port = _coerce_port(config.get('port'), DEFAULT_MYSQL_PORT)
+    port = _coerce_int(config.get('port'), DEFAULT_MYSQL_PORT)
     user = config.get('user') or 'root'
     password = config.get('password')
     database = config.get('database') or 'suricata'
@@ -60,6 +62,8 @@ def create_mysql_engine(config: Dict[str, Any]) -> Tuple[str, Engine]:
 
     engine = create_engine(
         url,
+        pool_size=_coerce_int(config.get('pool_size'), DEFAULT_POOL_SIZE),
+        max_overflow=_coerce_int(config.get('max_overflow'), DEFAULT_MAX_OVERFLOW),
         pool_pre_ping=True,
         pool_recycle=3600,
         echo=bool(config.get('echo', False)),
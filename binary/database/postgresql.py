@@ -8,9 +8,11 @@ from sqlalchemy.engine import Engine
 
 
 DEFAULT_POSTGRES_PORT = 5432
+DEFAULT_POOL_SIZE = 10
+DEFAULT_MAX_OVERFLOW = 20
 
 
-def _coerce_port(value: Any, default: int) -> int:
+def _coerce_int(value: Any, default: int) -> int:
     try:
         return int(value)
     except (TypeError, ValueError):
@@ -33,7 +35,7 @@ def _build_query_string(params: Any) -> str:
 def create_postgresql_engine(config: Dict[str, Any]) -> Tuple[str, Engine]:
     """Create a SQLAlchemy engine for PostgreSQL and return the URL and engine."""
     host = config.get('host') or 'localhost'
-    port = _coerce_port(config.get('port'), DEFAULT_POSTGRES_PORT)
+    port = _coerce_int(config.get('port'), DEFAULT_POSTGRES_PORT)
     user = config.get('user') or 'postgres'
     password = config.get('password')
     database = config.get('database') or 'suricata'
@@ -51,6 +53,8 @@ def create_postgresql_engine(config: Dict[str, Any]) -> Tuple[str, Engine]:
 
     engine = create_engine(
         url,
+        pool_size=_coerce_int(config.get('pool_size'), DEFAULT_POOL_SIZE),
+        max_overflow=_coerce_int(config.get('max_overflow'), DEFAULT_MAX_OVERFLOW),
         pool_pre_ping=True,
         pool_recycle=3600,
         echo=bool(config.get('echo', False)),
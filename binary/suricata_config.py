@@ -1,17 +1,38 @@
 import yaml
 import os
+import stat
+import tempfile
+import threading
 from typing import Dict, List, Any
 
+# libyaml-backed loader/dumper shared by every module that reads or writes YAML
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+    print("WARNING: PyYAML is not built with libyaml. suricata.yaml will be parsed and written with the slower pure-Python loader/dumper.")
+
 class SuricataConfig:
     def __init__(self, config_path: str):
         self.config_path = config_path
         self._config_data = None
+        self._config_signature = None
+        self._lock = threading.Lock()
     
     def load(self) -> Dict[str, Any]:
+        """Return the parsed config. The dict is shared between callers; treat it as read-only."""
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                self._config_data = yaml.safe_load(f)
-            return self._config_data
+            with self._lock:
+                # Re-parse only when the file was modified or replaced since the last load
+                signature = self._file_signature()
+                if self._config_data is not None and signature == self._config_signature:
+                    return self._config_data
+
+                # Binary mode lets libyaml decode the UTF-8 bytes itself
+                with open(self.config_path, 'rb') as f:
+                    self._config_data = yaml.load(f, Loader=SafeLoader)
+                self._config_signature = signature
+                return self._config_data
         except FileNotFoundError:
             raise FileNotFoundError(f"Config file not found: {self.config_path}")
         except yaml.YAMLError as e:
@@ -19,11 +40,57 @@ class SuricataConfig:
     
     def save(self, config_data: Dict[str, Any]) -> None:
         try:
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                yaml.dump(config_data, f, default_flow_style=False, indent=2)
-            self._config_data = config_data
+            with self._lock:
+                self._write_atomic(config_data)
+                # Write through so the next load() is served without re-parsing
+                self._config_data = config_data
+                self._config_signature = self._file_signature()
         except Exception as e:
             raise IOError(f"Failed to save config: {e}")
+
+    def _write_atomic(self, config_data: Dict[str, Any]) -> None:
+        """Write to a temp file and rename it over the config, so readers never see a partial file"""
+        target = os.path.realpath(self.config_path)
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(target),
+                                            prefix=f".{os.path.basename(target)}.", suffix='.tmp')
+        except PermissionError:
+            # No write access to the directory; fall back to rewriting the file in place
+            with open(target, 'w', encoding='utf-8') as f:
+                yaml.dump(config_data, f, Dumper=SafeDumper, default_flow_style=False, indent=2)
+            return
+
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                yaml.dump(config_data, f, Dumper=SafeDumper, default_flow_style=False, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            self._copy_file_owner(target, tmp_path)
+            os.replace(tmp_path, target)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    @staticmethod
+    def _copy_file_owner(source: str, destination: str) -> None:
+        """Give the replacement file the original's permissions and, where allowed, owner"""
+        try:
+            st = os.stat(source)
+        except FileNotFoundError:
+            return
+        os.chmod(destination, stat.S_IMODE(st.st_mode))
+        if hasattr(os, 'chown'):
+            try:
+                os.chown(destination, st.st_uid, st.st_gid)
+            except PermissionError:
+                pass
+
+    def _file_signature(self):
+        stat = os.stat(self.config_path)
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
     
     def get_interfaces(self) -> List[str]:
         if not self._config_data:
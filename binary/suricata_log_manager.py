@@ -1,8 +1,11 @@
 import os
 import json
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
 
 class SuricataLogManager:
+    # Bytes read per step when tailing a log file from its end
+    TAIL_BLOCK_SIZE = 64 * 1024
+
     def __init__(self, log_directory: str):
         self.log_directory = log_directory
     
@@ -11,17 +14,15 @@ class SuricataLogManager:
         return self._read_log_file(fast_log_path, lines)
     
     def get_eve_log(self, lines: int = 100) -> List[Dict[str, Any]]:
+        return list(self.iter_eve_log(lines))
+    
+    def iter_eve_log(self, lines: int = 100) -> Iterator[Dict[str, Any]]:
         eve_log_path = os.path.join(self.log_directory, 'eve.json')
-        log_lines = self._read_log_file(eve_log_path, lines)
-        
-        json_logs = []
-        for line in log_lines:
+        for line in self._read_log_file(eve_log_path, lines):
             try:
-                json_logs.append(json.loads(line))
+                yield json.loads(line)
             except json.JSONDecodeError:
                 continue
-        
-        return json_logs
     
     def get_stats_log(self) -> Optional[Dict[str, Any]]:
         stats_log_path = os.path.join(self.log_directory, 'stats.log')
@@ -35,12 +36,27 @@ class SuricataLogManager:
         return None
     
     def _read_log_file(self, filepath: str, lines: int) -> List[str]:
+        """Return the last `lines` lines, reading backwards from the end of the file"""
+        if lines <= 0:
+            return []
         try:
-            if not os.path.exists(filepath):
-                return []
+            with open(filepath, 'rb') as f:
+                position = f.seek(0, os.SEEK_END)
+                blocks = []
+                newlines = 0
+                # One newline more than needed guarantees the first kept line is complete
+                while position > 0 and newlines <= lines:
+                    step = min(self.TAIL_BLOCK_SIZE, position)
+                    position -= step
+                    f.seek(position)
+                    block = f.read(step)
+                    blocks.append(block)
+                    newlines += block.count(b'\n')
             
-            with open(filepath, 'r', encoding='utf-8') as f:
-                all_lines = f.readlines()
-                return [line.strip() for line in all_lines[-lines:]]
+            tail = b''.join(reversed(blocks)).split(b'\n')
+            if tail[-1] == b'':
+                tail.pop()
+            return [line.decode('utf-8').strip() for line in tail[-lines:]]
         except Exception:
+            # Missing or unreadable log files read as empty
             return []
\ No newline at end of file
@@ -1,6 +1,8 @@
 import os
 import time
+import threading
 import subprocess
+from collections import OrderedDict
 from typing import Dict, Any, List
 import json
 
@@ -14,6 +16,21 @@ except ImportError:
 class SuricataRRDManager:
     """Manager for RRDtool-based metrics collection and graphing"""
 
+    # Maximum number of (metric, timespan) graphs tracked for reuse
+    GRAPH_CACHE_SIZE = 256
+
+    # Graph/fetch window in seconds for each supported timespan
+    TIMESPAN_SECONDS = {
+        '5m': 300,
+        '15m': 900,
+        '30m': 1800,
+        '1h': 3600,
+        '6h': 21600,
+        '24h': 86400,
+        '7d': 604800,
+        '30d': 2592000
+    }
+
     def __init__(self, rrd_directory: str = "/var/lib/suricata/rrd", log_directory: str = "/var/log/suricata", db_manager=None):
         self.rrd_directory = rrd_directory
         self.log_directory = log_directory
@@ -36,6 +53,16 @@ class SuricataRRDManager:
         self.udp_rrd = os.path.join(self.rrd_directory, "udp_traffic.rrd")
         self.icmp_rrd = os.path.join(self.rrd_directory, "icmp_traffic.rrd")
         self.alerts_rrd = os.path.join(self.rrd_directory, "alerts.rrd")
+        self.rrd_files = {
+            'tcp': self.tcp_rrd,
+            'udp': self.udp_rrd,
+            'icmp': self.icmp_rrd,
+            'alerts': self.alerts_rrd
+        }
+
+        # Rendered graphs keyed by (metric, timespan) -> RRD mtime at render time
+        self._graph_cache = OrderedDict()
+        self._graph_lock = threading.Lock()
 
         # Initialize RRD databases
         self._init_rrd_databases()
@@ -45,14 +72,7 @@ class SuricataRRDManager:
         if not self.enabled:
             return
 
-        rrd_files = {
-            'tcp': self.tcp_rrd,
-            'udp': self.udp_rrd,
-            'icmp': self.icmp_rrd,
-            'alerts': self.alerts_rrd
-        }
-
-        for name, rrd_file in rrd_files.items():
+        for name, rrd_file in self.rrd_files.items():
             if not os.path.exists(rrd_file):
                 self._create_rrd(rrd_file, name)
             else:
@@ -63,15 +83,8 @@ class SuricataRRDManager:
         if not self.enabled:
             return {'success': False, 'message': 'RRDtool not available'}
 
-        rrd_files = {
-            'tcp': self.tcp_rrd,
-            'udp': self.udp_rrd,
-            'icmp': self.icmp_rrd,
-            'alerts': self.alerts_rrd
-        }
-
         regenerated = []
-        for name, rrd_file in rrd_files.items():
+        for name, rrd_file in self.rrd_files.items():
             try:
                 # Delete old RRD file if exists
                 if os.path.exists(rrd_file):
@@ -251,35 +264,25 @@ class SuricataRRDManager:
         if not self.enabled:
             return {'success': False, 'message': 'RRDtool not available'}
 
-        rrd_files = {
-            'tcp': self.tcp_rrd,
-            'udp': self.udp_rrd,
-            'icmp': self.icmp_rrd,
-            'alerts': self.alerts_rrd
-        }
+        rrd_file = self.rrd_files.get(metric, self.tcp_rrd)
 
-        rrd_file = rrd_files.get(metric, self.tcp_rrd)
-
-        if not os.path.exists(rrd_file):
+        try:
+            rrd_mtime = os.stat(rrd_file).st_mtime_ns
+        except FileNotFoundError:
             return {'success': False, 'message': 'RRD file not found'}
 
-        # Generate graph
         graph_file = os.path.join(self.rrd_directory, f'{metric}_{timespan}.png')
 
+        # Reuse the last rendered graph until the RRD file receives new data
+        cache_key = (metric, timespan)
+        with self._graph_lock:
+            if self._graph_cache.get(cache_key) == rrd_mtime and os.path.exists(graph_file):
+                self._graph_cache.move_to_end(cache_key)
+                return {'success': True, 'graph_path': graph_file}
+
+        # Generate graph
         try:
-            # Map timespan to seconds
-            timespan_map = {
-                '5m': 300,
-                '15m': 900,
-                '30m': 1800,
-                '1h': 3600,
-                '6h': 21600,
-                '24h': 86400,
-                '7d': 604800,
-                '30d': 2592000
-            }
-
-            seconds = timespan_map.get(timespan, 3600)
+            seconds = self.TIMESPAN_SECONDS.get(timespan, 3600)
 
             if metric == 'alerts':
                 # Alerts graph
@@ -324,6 +327,12 @@ class SuricataRRDManager:
                     'GPRINT:bytes:MAX:Maximum\\:%8.0lf'
                 )
 
+            with self._graph_lock:
+                self._graph_cache[cache_key] = rrd_mtime
+                self._graph_cache.move_to_end(cache_key)
+                if len(self._graph_cache) > self.GRAPH_CACHE_SIZE:
+                    self._graph_cache.popitem(last=False)
+
             return {'success': True, 'graph_path': graph_file}
 
         except Exception as e:
@@ -334,31 +343,13 @@ class SuricataRRDManager:
         if not self.enabled:
             return {'success': False, 'message': 'RRDtool not available'}
 
-        rrd_files = {
-            'tcp': self.tcp_rrd,
-            'udp': self.udp_rrd,
-            'icmp': self.icmp_rrd,
-            'alerts': self.alerts_rrd
-        }
-
-        rrd_file = rrd_files.get(metric, self.tcp_rrd)
+        rrd_file = self.rrd_files.get(metric, self.tcp_rrd)
 
         if not os.path.exists(rrd_file):
             return {'success': False, 'message': 'RRD file not found'}
 
         try:
-            timespan_map = {
-                '5m': 300,
-                '15m': 900,
-                '30m': 1800,
-                '1h': 3600,
-                '6h': 21600,
-                '24h': 86400,
-                '7d': 604800,
-                '30d': 2592000
-            }
-
-            seconds = timespan_map.get(timespan, 3600)
+            seconds = self.TIMESPAN_SECONDS.get(timespan, 3600)
 
             # Fetch data from RRD
             result = rrdtool.fetch(
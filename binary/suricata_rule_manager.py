@@ -1,4 +1,5 @@
 import os
+import hashlib
 from typing import Dict, List
 
 class SuricataRuleManager:
@@ -8,10 +9,12 @@ class SuricataRuleManager:
     def get_rule_files(self) -> List[Dict[str, str]]:
         rule_files = []
         try:
-            if not os.path.exists(self.rules_directory):
+            try:
+                filenames = os.listdir(self.rules_directory)
+            except FileNotFoundError:
                 return rule_files
             
-            for filename in os.listdir(self.rules_directory):
+            for filename in filenames:
                 if filename.endswith('.rules'):
                     filepath = os.path.join(self.rules_directory, filename)
                     try:
@@ -35,6 +38,16 @@ class SuricataRuleManager:
         
         return rule_files
     
+    def get_signature(self) -> str:
+        """Build a change signature from the names, mtimes and sizes of the rule files"""
+        digest = hashlib.blake2b(digest_size=8)
+        with os.scandir(self.rules_directory) as entries:
+            for entry in sorted(entries, key=lambda e: e.name):
+                if entry.name.endswith('.rules'):
+                    stat = entry.stat()
+                    digest.update(f"{entry.name}:{stat.st_mtime_ns}:{stat.st_size};".encode())
+        return digest.hexdigest()
+
     def save_rule_file(self, filename: str, content: str) -> None:
         if not filename.endswith('.rules'):
             filename += '.rules'
@@ -97,6 +97,10 @@ class Config:
     DB_PASSWORD = _get_env('DB_PASSWORD', 'DATABASE_PASSWORD', default='')
     DB_NAME = _get_env('DB_NAME', 'DATABASE_NAME', default='suricata')
 
+    # Connection pool shared by request handlers and background workers
+    DB_POOL_SIZE = int(_get_env('DB_POOL_SIZE', default='10'))
+    DB_MAX_OVERFLOW = int(_get_env('DB_MAX_OVERFLOW', default='20'))
+
     _retention_raw = _get_env('DB_RETENTION_DAYS', default='30')
     try:
         DB_RETENTION_DAYS = max(int(_retention_raw), 0)
@@ -111,6 +115,8 @@ class Config:
     FLASK_HOST = _get_env('FLASK_HOST', default='0.0.0.0')
     FLASK_PORT = int(_get_env('FLASK_PORT', default='5000'))
     FLASK_DEBUG = _get_env('FLASK_DEBUG', default='True').strip().lower() == 'true'
+    # Largest accepted request body (bytes); larger uploads get 413
+    MAX_CONTENT_LENGTH = int(_get_env('MAX_CONTENT_LENGTH', default='2097152'))
 
     # Dashboard settings
     AUTO_REFRESH_INTERVAL = int(_get_env('AUTO_REFRESH_INTERVAL', default='5000'))
@@ -0,0 +1,112 @@
+"""
+Log reader tests - byte-offset handling of the eve.json/stats.log followers and tail reads
+"""
+import os
+
+import pytest
+
+from binary.app.background_tasks import BackgroundTasks
+from binary.suricata_log_manager import SuricataLogManager
+
+
+@pytest.fixture
+def tasks():
+    tasks = BackgroundTasks(engine=None, config=None)
+    # Small reads so every test crosses several block boundaries
+    tasks.LOG_READ_SIZE = 8
+    return tasks
+
+
+def test_partial_line_is_held_back_until_completed(tasks, tmp_path):
+    log = tmp_path / 'eve.json'
+    log.write_bytes(b'{"a": 1}\n{"b":')
+
+    with open(log, 'rb') as handle:
+        assert list(tasks._read_complete_lines(handle)) == [b'{"a": 1}']
+        assert handle.tell() == len(b'{"a": 1}\n')
+
+        with open(log, 'ab') as writer:
+            writer.write(b' 2}\n')
+        assert list(tasks._read_complete_lines(handle)) == [b'{"b": 2}']
+        assert list(tasks._read_complete_lines(handle)) == []
+
+
+def test_line_longer_than_read_size_is_returned_whole(tasks, tmp_path):
+    long_line = b'x' * (tasks.LOG_READ_SIZE * 5)
+    log = tmp_path / 'eve.json'
+    log.write_bytes(b'short\n' + long_line + b'\nend\n')
+
+    with open(log, 'rb') as handle:
+        assert list(tasks._read_complete_lines(handle)) == [b'short', long_line, b'end']
+
+
+def test_unchanged_log_is_not_rotated(tasks, tmp_path):
+    log = tmp_path / 'stats.log'
+    log.write_bytes(b'line\n')
+
+    with open(log, 'rb') as handle:
+        list(tasks._read_complete_lines(handle))
+        assert not tasks._log_rotated(str(log), handle)
+
+
+def test_truncation_resets_the_follower(tasks, tmp_path):
+    log = tmp_path / 'stats.log'
+    log.write_bytes(b'first line\nsecond line\n')
+
+    with open(log, 'rb') as handle:
+        list(tasks._read_complete_lines(handle))
+        log.write_bytes(b'new\n')
+        assert tasks._log_rotated(str(log), handle)
+
+    with open(log, 'rb') as handle:
+        assert list(tasks._read_complete_lines(handle)) == [b'new']
+
+
+def test_inode_rotation_resets_the_follower(tasks, tmp_path):
+    log = tmp_path / 'eve.json'
+    log.write_bytes(b'old 1\n')
+
+    with open(log, 'rb') as handle:
+        list(tasks._read_complete_lines(handle))
+        with open(log, 'ab') as writer:
+            writer.write(b'old 2\n')
+        os.rename(log, tmp_path / 'eve.json.1')
+        log.write_bytes(b'new 1\nnew 2\nnew 3\n')
+
+        assert tasks._log_rotated(str(log), handle)
+        # The rotated file's tail is still readable through the old handle
+        assert list(tasks._read_complete_lines(handle)) == [b'old 2']
+
+    with open(log, 'rb') as handle:
+        assert list(tasks._read_complete_lines(handle)) == [b'new 1', b'new 2', b'new 3']
+
+
+@pytest.fixture
+def log_manager(tmp_path):
+    manager = SuricataLogManager(str(tmp_path))
+    manager.TAIL_BLOCK_SIZE = 16
+    return manager
+
+
+@pytest.mark.parametrize('count', [1, 3, 10, 50, 200])
+def test_tail_matches_the_last_lines_across_blocks(log_manager, tmp_path, count):
+    lines = [f'line {i}:' + 'x' * (i % 23) for i in range(100)]
+    log = tmp_path / 'fast.log'
+    log.write_text('\n'.join(lines) + '\n')
+
+    assert log_manager._read_log_file(str(log), count) == lines[-count:]
+
+
+def test_tail_without_trailing_newline(log_manager, tmp_path):
+    log = tmp_path / 'fast.log'
+    log.write_text('a\nbb\nccc')
+
+    assert log_manager._read_log_file(str(log), 2) == ['bb', 'ccc']
+
+
+def test_tail_of_missing_file_or_no_lines_is_empty(log_manager, tmp_path):
+    log = tmp_path / 'fast.log'
+    assert log_manager._read_log_file(str(log), 10) == []
+
+    log.write_text('a\n')
+    assert log_manager._read_log_file(str(log), 0) == []